@@ -1,8 +1,13 @@
+import os
+import copy
 import yaml
+import logging
+import functools
+import hashlib
 import json
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, AsyncGenerator
+from typing import Dict, List, Any, Optional, Tuple, Union, AsyncGenerator, Callable
 
 from pydantic import BaseModel, Field
 from llama_index.core import VectorStoreIndex
@@ -13,6 +18,8 @@ from llama_index.core.prompts import PromptTemplate
 
 from src.prompts import get_prompt, PROMPT_NAMES
 
+logger = logging.getLogger(__name__)
+
 
 # Simple streaming helper - returns final result directly
 async def stream_structured_predict(
@@ -81,14 +88,30 @@ async def stream_structured_predict_with_events(
 
         final_response = partial_response
 
-    # Yield final result
+    # Yield final result as the structured model; consumers serialize it once
     yield {
         "type": "complete",
         "persona": persona,
-        "result": final_response.model_dump(),
+        "result": final_response,
     }
 
 
+# Shared across workflow runs so concurrent requests can't flood the LLM backend
+_agent_semaphore: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+
+def get_agent_semaphore() -> asyncio.Semaphore:
+    """Get the process-wide agent LLM call limiter for the running loop"""
+    global _agent_semaphore
+    loop = asyncio.get_running_loop()
+    if _agent_semaphore is None or _agent_semaphore[0] is not loop:
+        _agent_semaphore = (
+            loop,
+            asyncio.Semaphore(int(os.getenv("AGENT_MAX_CONCURRENCY", "8"))),
+        )
+    return _agent_semaphore[1]
+
+
 # Pydantic models for structured outputs
 class RFEAnalysis(BaseModel):
     """Structure for agent RFE analysis output"""
@@ -172,31 +195,15 @@ class RFEAgentManager:
     def __init__(self):
         self.indices: Dict[str, VectorStoreIndex] = {}
         self.agent_configs: Dict[str, Dict] = {}
+        # Completed analyses keyed by (persona, prompt digest), oldest first
+        self.analysis_cache: Dict[Tuple[str, str], RFEAnalysis] = {}
+        self.analysis_cache_size = int(os.getenv("AGENT_ANALYSIS_CACHE_SIZE", "128"))
         self.load_agent_configurations()
 
     def load_agent_configurations(self):
         """Load agent configs from YAML files"""
-        # Get agents directory relative to this file's location
-        agents_dir = Path(__file__).parent / "agents"
-
-        if not agents_dir.exists():
-            print(f"Warning: Agents directory not found at {agents_dir}")
-            return
-
-        for yaml_file in agents_dir.glob("*.yaml"):
-            if yaml_file.name.startswith("agent-schema"):
-                continue
-
-            try:
-                with open(yaml_file, "r") as f:
-                    config = yaml.safe_load(f)
-
-                persona = config.get("persona")
-                if persona:
-                    self.agent_configs[persona] = config
-                    print(f"✅ Loaded agent config: {persona}")
-            except Exception as e:
-                print(f"❌ Error loading {yaml_file}: {e}")
+        # Copy so edits to this manager's configs can't leak into the cache
+        self.agent_configs.update(copy.deepcopy(_load_agent_personas()))
 
     async def get_agent_index(self, persona: str) -> Optional[VectorStoreIndex]:
         """Get or load index for agent persona"""
@@ -249,13 +256,78 @@ class RFEAgentManager:
             },
         )
 
+        # Re-runs of the same RFE skip the LLM round trip entirely
+        cache_key = (
+            persona,
+            hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest(),
+        )
+        cached = self.analysis_cache.get(cache_key)
+        if cached is not None:
+            yield {"type": "complete", "persona": persona, "result": cached}
+            return
+
         prompt_template = PromptTemplate(prompt)
 
-        # Stream the analysis with events
-        async for stream_event in stream_structured_predict_with_events(
-            RFEAnalysis, prompt_template, persona
-        ):
-            yield stream_event
+        # Stream the analysis with events; only real LLM calls take a slot
+        async with get_agent_semaphore():
+            async for stream_event in stream_structured_predict_with_events(
+                RFEAnalysis, prompt_template, persona
+            ):
+                if stream_event.get("type") == "complete":
+                    self._cache_analysis(cache_key, stream_event["result"])
+                yield stream_event
+
+    def _cache_analysis(self, key: Tuple[str, str], result: RFEAnalysis) -> None:
+        """Store a completed analysis, evicting the oldest entry when full"""
+        if self.analysis_cache_size <= 0:
+            return
+        self.analysis_cache.pop(key, None)
+        if len(self.analysis_cache) >= self.analysis_cache_size:
+            del self.analysis_cache[next(iter(self.analysis_cache))]
+        self.analysis_cache[key] = result
+
+    async def analyze_rfe_concurrently(
+        self,
+        personas: Dict[str, Dict[str, Any]],
+        rfe_description: str,
+        on_event: Callable[[str, Dict[str, Any], Dict[str, Any]], None],
+    ) -> AsyncGenerator[Tuple[str, RFEAnalysis], None]:
+        """Analyze with all personas concurrently, yielding results as agents finish"""
+
+        # In-flight LLM calls are bounded inside analyze_rfe_streaming;
+        # failed agents are skipped like before
+        async def run_persona(
+            persona: str, config: Dict[str, Any]
+        ) -> Tuple[str, Optional[RFEAnalysis]]:
+            result = None
+            try:
+                async for stream_event in self.analyze_rfe_streaming(
+                    persona, rfe_description, config
+                ):
+                    if stream_event.get("type") == "complete":
+                        result = stream_event["result"]
+                        stream_event = {
+                            **stream_event,
+                            "result": result.model_dump(mode="json"),
+                        }
+                    on_event(persona, config, stream_event)
+            except Exception:
+                logger.exception("Agent %s error", persona)
+            return persona, result
+
+        tasks = [
+            asyncio.create_task(run_persona(persona, config))
+            for persona, config in personas.items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                persona, result = await next_done
+                if result is not None:
+                    yield persona, result
+        finally:
+            # Don't leave agents running if the consumer stops early
+            for task in tasks:
+                task.cancel()
 
     async def synthesize_analyses(self, analyses: List[Dict]) -> Dict[str, Any]:
         """Simple synthesis"""
@@ -312,7 +384,36 @@ class RFEAgentManager:
         return response.model_dump()
 
 
+@functools.cache
+def _load_agent_personas() -> Dict[str, Dict]:
+    """Load agent persona configs from YAML files once per process"""
+    agent_configs: Dict[str, Dict] = {}
+
+    # Get agents directory relative to this file's location
+    agents_dir = Path(__file__).parent / "agents"
+
+    if not agents_dir.exists():
+        print(f"Warning: Agents directory not found at {agents_dir}")
+        return agent_configs
+
+    for yaml_file in agents_dir.glob("*.yaml"):
+        if yaml_file.name.startswith("agent-schema"):
+            continue
+
+        try:
+            with open(yaml_file, "r") as f:
+                config = yaml.safe_load(f)
+
+            persona = config.get("persona")
+            if persona:
+                agent_configs[persona] = config
+                print(f"✅ Loaded agent config: {persona}")
+        except Exception as e:
+            print(f"❌ Error loading {yaml_file}: {e}")
+
+    return agent_configs
+
+
 async def get_agent_personas() -> Dict[str, Dict]:
     """Get all available agent personas"""
-    manager = RFEAgentManager()
-    return manager.agent_configs
+    return copy.deepcopy(_load_agent_personas())
@@ -8,6 +8,8 @@ the initial RFE creation process.
 
 import re
 import time
+import asyncio
+import functools
 from typing import Any, Dict, List, Literal, Optional
 
 from llama_index.core import Settings
@@ -33,7 +35,7 @@ from llama_index.core.chat_ui.events import (
 )
 
 from src.settings import init_settings
-from src.agents import RFEAgentManager, get_agent_personas
+from src.agents import RFEAgentManager, RFEAnalysis
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
@@ -44,6 +46,15 @@ def create_jira_rfe_to_architecture_workflow() -> Workflow:
     return JiraRFEToArchitectureWorkflow(timeout=300.0)
 
 
+# Focus on implementation agents
+ARCHITECTURE_AGENTS = {
+    "backend_eng",
+    "frontend_eng",
+    "architect",
+    "uxd",
+}
+
+
 class JiraRFEInput(BaseModel):
     """Input for processing a Jira RFE"""
 
@@ -56,14 +67,16 @@ class JiraRFEInput(BaseModel):
 
 class ArchitectureAnalysisEvent(Event):
     rfe_input: JiraRFEInput
-    agent_insights: List[Dict[str, Any]]
+    agent_insights: List[RFEAnalysis]
+    start_time: float
 
 
 class ArtifactGenerationEvent(Event):
     rfe_input: JiraRFEInput
-    agent_insights: List[Dict[str, Any]]
+    agent_insights: List[RFEAnalysis]
     architecture_content: str
     epics_content: str
+    start_time: float
 
 
 class JiraRFEWorkflowUIEventData(BaseModel):
@@ -92,12 +105,19 @@ class JiraRFEToArchitectureWorkflow(Workflow):
         super().__init__(**kwargs)
         self.llm: LLM = Settings.llm
         self.agent_manager = RFEAgentManager()
+        # Filter to relevant agents for architecture/implementation analysis
+        self.architecture_agents = {
+            k: v
+            for k, v in self.agent_manager.agent_configs.items()
+            if k in ARCHITECTURE_AGENTS
+        }
 
     @step
     async def analyze_jira_rfe(
         self, ctx: Context, ev: StartEvent
     ) -> ArchitectureAnalysisEvent:
         """Analyze the Jira RFE using AI agents"""
+        start_time = time.perf_counter()
 
         rfe_key = ev.get("rfe_key", "")
         rfe_content = ev.get("rfe_content", "")
@@ -121,24 +141,11 @@ class JiraRFEToArchitectureWorkflow(Workflow):
             )
         )
 
-        # Get agent personas and analyze RFE for architecture/implementation
-        agent_personas = await get_agent_personas()
-        agent_insights = []
-
-        if agent_personas:
-            # Filter to relevant agents for architecture/implementation analysis
-            architecture_agents = {
-                k: v
-                for k, v in agent_personas.items()
-                if k
-                in [
-                    "backend_eng",
-                    "frontend_eng",
-                    "architect",
-                    "uxd",
-                ]  # Focus on implementation agents
-            }
+        # Analyze RFE for architecture/implementation
+        architecture_agents = self.architecture_agents
+        agent_insights: List[RFEAnalysis] = []
 
+        if architecture_agents:
             analysis_prompt = f"""
             Analyze this Jira RFE for detailed architecture and implementation planning:
             
@@ -155,33 +162,47 @@ class JiraRFEToArchitectureWorkflow(Workflow):
             - Epic/story breakdown
             """
 
-            for persona_key, persona_config in architecture_agents.items():
-                try:
-                    async for stream_event in self.agent_manager.analyze_rfe_streaming(
-                        persona_key, analysis_prompt, persona_config
-                    ):
-                        # Forward agent events to multi-agent component
-                        ctx.write_event_to_stream(
-                            UIEvent(
-                                type="multi_agent_analysis",
-                                data={
-                                    "agent_key": persona_key,
-                                    "agent_name": persona_config.get(
-                                        "name", persona_key
-                                    ),
-                                    "agent_role": persona_config.get("role", "Analyst"),
-                                    "stream_event": stream_event,
-                                },
-                            )
-                        )
-
-                        if stream_event.get("type") == "complete":
-                            agent_insights.append(stream_event.get("result"))
-                except Exception as e:
-                    print(f"Agent {persona_key} error: {e}")
+            def forward_agent_event(
+                persona_key: str,
+                persona_config: Dict[str, Any],
+                stream_event: Dict[str, Any],
+            ) -> None:
+                # Forward agent events to multi-agent component
+                ctx.write_event_to_stream(
+                    UIEvent(
+                        type="multi_agent_analysis",
+                        data={
+                            "agent_key": persona_key,
+                            "agent_name": persona_config.get("name", persona_key),
+                            "agent_role": persona_config.get("role", "Analyst"),
+                            "stream_event": stream_event,
+                        },
+                    )
+                )
+
+            results: Dict[str, RFEAnalysis] = {}
+            async for persona_key, insight in self.agent_manager.analyze_rfe_concurrently(
+                architecture_agents, analysis_prompt, forward_agent_event
+            ):
+                results[persona_key] = insight
+                ctx.write_event_to_stream(
+                    UIEvent(
+                        type="jira_rfe_workflow_progress",
+                        data=JiraRFEWorkflowUIEventData(
+                            stage="analyzing",
+                            rfe_key=rfe_key,
+                            description=f"{architecture_agents[persona_key].get('name', persona_key)} finished ({len(results)}/{len(architecture_agents)} agents)",
+                            progress=10
+                            + 30 * len(results) // len(architecture_agents),
+                        ),
+                    )
+                )
+
+            # Keep prompts stable across runs regardless of completion order
+            agent_insights = [results[k] for k in architecture_agents if k in results]
 
         return ArchitectureAnalysisEvent(
-            rfe_input=rfe_input, agent_insights=agent_insights
+            rfe_input=rfe_input, agent_insights=agent_insights, start_time=start_time
         )
 
     @step
@@ -196,37 +217,38 @@ class JiraRFEToArchitectureWorkflow(Workflow):
                 data=JiraRFEWorkflowUIEventData(
                     stage="generating_architecture",
                     rfe_key=ev.rfe_input.rfe_key,
-                    description="Generating architecture document...",
+                    description="Generating architecture document and epics & stories...",
                     progress=40,
                 ),
             )
         )
 
-        architecture_content = await self._generate_architecture_from_rfe(
-            ev.rfe_input, ev.agent_insights
-        )
-
-        ctx.write_event_to_stream(
-            UIEvent(
-                type="jira_rfe_workflow_progress",
-                data=JiraRFEWorkflowUIEventData(
-                    stage="generating_epics",
-                    rfe_key=ev.rfe_input.rfe_key,
-                    description="Generating epics and user stories...",
-                    progress=70,
-                ),
-            )
-        )
-
-        epics_content = await self._generate_epics_from_rfe(
-            ev.rfe_input, ev.agent_insights
-        )
+        # Both prompts embed the same agent analysis text, so build it once
+        insights_text = self._format_agent_insights(ev.agent_insights)
+
+        # Both documents only depend on the RFE and agent insights, so run the
+        # LLM calls together; the task group cancels the other if one fails
+        try:
+            async with asyncio.TaskGroup() as tg:
+                architecture_task = tg.create_task(
+                    self._generate_architecture_from_rfe(ev.rfe_input, insights_text)
+                )
+                epics_task = tg.create_task(
+                    self._generate_epics_from_rfe(ev.rfe_input, insights_text)
+                )
+        except* Exception as eg:
+            # Surface the underlying LLM error rather than the group wrapper
+            raise eg.exceptions[0]
+
+        architecture_content = architecture_task.result()
+        epics_content = epics_task.result()
 
         return ArtifactGenerationEvent(
             rfe_input=ev.rfe_input,
             agent_insights=ev.agent_insights,
             architecture_content=architecture_content,
             epics_content=epics_content,
+            start_time=ev.start_time,
         )
 
     @step
@@ -234,6 +256,7 @@ class JiraRFEToArchitectureWorkflow(Workflow):
         self, ctx: Context, ev: ArtifactGenerationEvent
     ) -> StopEvent:
         """Emit the generated architecture and epics artifacts"""
+        created_at = int(time.time())
 
         # Emit Architecture document
         ctx.write_event_to_stream(
@@ -241,7 +264,7 @@ class JiraRFEToArchitectureWorkflow(Workflow):
                 data=Artifact(
                     id="jira_architecture",
                     type=ArtifactType.DOCUMENT,
-                    created_at=int(time.time()),
+                    created_at=created_at,
                     data=DocumentArtifactData(
                         title=f"Architecture Document - {ev.rfe_input.rfe_key}",
                         content=ev.architecture_content,
@@ -258,7 +281,7 @@ class JiraRFEToArchitectureWorkflow(Workflow):
                 data=Artifact(
                     id="jira_epics_stories",
                     type=ArtifactType.DOCUMENT,
-                    created_at=int(time.time()),
+                    created_at=created_at,
                     data=DocumentArtifactData(
                         title=f"Epics & Stories - {ev.rfe_input.rfe_key}",
                         content=ev.epics_content,
@@ -286,23 +309,25 @@ class JiraRFEToArchitectureWorkflow(Workflow):
                 "rfe_key": ev.rfe_input.rfe_key,
                 "architecture_content": ev.architecture_content,
                 "epics_content": ev.epics_content,
-                "agent_insights": ev.agent_insights,
+                "agent_insights": [
+                    insight.model_dump(mode="json") for insight in ev.agent_insights
+                ],
+                "processing_time": time.perf_counter() - ev.start_time,
             }
         )
 
+    @staticmethod
+    def _format_agent_insights(agent_insights: List[RFEAnalysis]) -> str:
+        """Render agent insights as prompt text"""
+        return "\n".join(
+            f"{insight.persona}: {insight.analysis}" for insight in agent_insights
+        )
+
     async def _generate_architecture_from_rfe(
-        self, rfe_input: JiraRFEInput, agent_insights: List[Dict[str, Any]]
+        self, rfe_input: JiraRFEInput, insights_text: str
     ) -> str:
         """Generate architecture document from Jira RFE and agent analysis"""
 
-        insights_text = "\n".join(
-            [
-                f"{insight.get('persona', 'Agent')}: {insight.get('analysis', 'No analysis')}"
-                for insight in agent_insights
-                if insight
-            ]
-        )
-
         prompt = f"""
         Create a detailed architecture document based on this Jira RFE and agent analysis:
         
@@ -333,18 +358,10 @@ class JiraRFEToArchitectureWorkflow(Workflow):
         return response.text.strip()
 
     async def _generate_epics_from_rfe(
-        self, rfe_input: JiraRFEInput, agent_insights: List[Dict[str, Any]]
+        self, rfe_input: JiraRFEInput, insights_text: str
     ) -> str:
         """Generate epics and user stories from Jira RFE and agent analysis"""
 
-        insights_text = "\n".join(
-            [
-                f"{insight.get('persona', 'Agent')}: {insight.get('analysis', 'No analysis')}"
-                for insight in agent_insights
-                if insight
-            ]
-        )
-
         prompt = f"""
         Create detailed epics and user stories based on this Jira RFE and agent analysis:
         
@@ -390,5 +407,14 @@ class JiraRFEToArchitectureWorkflow(Workflow):
         return response.text.strip()
 
 
-# Export for LlamaDeploy
-jira_rfe_to_architecture_workflow = create_jira_rfe_to_architecture_workflow()
+@functools.cache
+def get_jira_rfe_to_architecture_workflow() -> Workflow:
+    """Create the shared workflow instance on first use"""
+    return create_jira_rfe_to_architecture_workflow()
+
+
+def __getattr__(name: str) -> Any:
+    # Export for LlamaDeploy, built lazily so importing this module has no side effects
+    if name == "jira_rfe_to_architecture_workflow":
+        return get_jira_rfe_to_architecture_workflow()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
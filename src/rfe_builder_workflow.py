@@ -3,6 +3,7 @@
 import time
 import json
 import asyncio
+import functools
 from typing import Any, Dict, List, Literal, Optional
 from enum import Enum
 
@@ -26,7 +27,7 @@ from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
 from src.settings import init_settings
-from src.agents import RFEAgentManager, get_agent_personas
+from src.agents import RFEAgentManager, RFEAnalysis
 
 
 class RFEPhase(str, Enum):
@@ -57,6 +58,17 @@ PHASE_2_ARTIFACTS = [
 ]
 
 
+# Agent personas consulted while building the RFE
+RFE_BUILDER_AGENTS = {
+    "UX_RESEARCHER",
+    "UX_FEATURE_LEAD",
+    "ENGINEERING_MANAGER",
+    "STAFF_ENGINEER",
+    "TECHNICAL_WRITER",
+    "UX_ARCHITECT",
+}
+
+
 class GenerateArtifactsEvent(Event):
     final_rfe: str
     context: Dict[str, Any]
@@ -85,6 +97,12 @@ class RFEBuilderWorkflow(Workflow):
         super().__init__(**kwargs)
         self.llm: LLM = Settings.llm
         self.agent_manager = RFEAgentManager()
+        # Persona filtering only depends on static config, so do it once
+        self.agent_personas = {
+            key: config
+            for key, config in self.agent_manager.agent_configs.items()
+            if key in RFE_BUILDER_AGENTS
+        }
 
     @step
     async def start_rfe_builder(
@@ -93,52 +111,49 @@ class RFEBuilderWorkflow(Workflow):
         """Simple start: get user input and go straight to RFE building"""
         user_msg = ev.get("user_msg", "")
 
-        # Get agent personas and build RFE
-        agent_personas = await get_agent_personas()
-
-        # Filter to only include specific agents
-        filtered_agents = {
-            "UX_RESEARCHER",
-            "UX_FEATURE_LEAD",
-            "ENGINEERING_MANAGER",
-            "STAFF_ENGINEER",
-            "TECHNICAL_WRITER",
-            "UX_ARCHITECT",
-        }
-
-        agent_personas = {
-            key: config
-            for key, config in agent_personas.items()
-            if key in filtered_agents
-        }
+        agent_personas = self.agent_personas
 
-        agent_insights = []
+        agent_insights: List[RFEAnalysis] = []
 
         if agent_personas:
-            for persona_key, persona_config in agent_personas.items():
-                try:
-                    async for stream_event in self.agent_manager.analyze_rfe_streaming(
-                        persona_key, user_msg, persona_config
-                    ):
-                        # Forward agent events to multi-agent component
-                        ctx.write_event_to_stream(
-                            UIEvent(
-                                type="multi_agent_analysis",
-                                data={
-                                    "agent_key": persona_key,
-                                    "agent_name": persona_config.get(
-                                        "name", persona_key
-                                    ),
-                                    "agent_role": persona_config.get("role", "Analyst"),
-                                    "stream_event": stream_event,
-                                },
-                            )
-                        )
 
-                        if stream_event.get("type") == "complete":
-                            agent_insights.append(stream_event.get("result"))
-                except Exception as e:
-                    print(f"Agent {persona_key} error: {e}")
+            def forward_agent_event(
+                persona_key: str,
+                persona_config: Dict[str, Any],
+                stream_event: Dict[str, Any],
+            ) -> None:
+                # Forward agent events to multi-agent component
+                ctx.write_event_to_stream(
+                    UIEvent(
+                        type="multi_agent_analysis",
+                        data={
+                            "agent_key": persona_key,
+                            "agent_name": persona_config.get("name", persona_key),
+                            "agent_role": persona_config.get("role", "Analyst"),
+                            "stream_event": stream_event,
+                        },
+                    )
+                )
+
+            results: Dict[str, RFEAnalysis] = {}
+            async for persona_key, insight in self.agent_manager.analyze_rfe_concurrently(
+                agent_personas, user_msg, forward_agent_event
+            ):
+                results[persona_key] = insight
+                ctx.write_event_to_stream(
+                    UIEvent(
+                        type="rfe_builder_progress",
+                        data=RFEBuilderUIEventData(
+                            phase=RFEPhase.BUILDING,
+                            stage="agent_analysis",
+                            description=f"{agent_personas[persona_key].get('name', persona_key)} finished ({len(results)}/{len(agent_personas)} agents)",
+                            progress=40 * len(results) // len(agent_personas),
+                        ),
+                    )
+                )
+
+            # Keep prompts stable across runs regardless of completion order
+            agent_insights = [results[k] for k in agent_personas if k in results]
 
         # Small delay to ensure agent completion events are processed first
         await asyncio.sleep(0.5)
@@ -172,9 +187,24 @@ class RFEBuilderWorkflow(Workflow):
 
         phase_1_artifacts = {}
 
-        # Generate only Phase 1 artifacts
-        for artifact_type, display_name in PHASE_1_ARTIFACTS:
-            content = await self._generate_simple_artifact(artifact_type, ev.final_rfe)
+        # Generate only Phase 1 artifacts; each depends only on the final RFE,
+        # and the task group cancels the others if one fails
+        try:
+            async with asyncio.TaskGroup() as tg:
+                artifact_tasks = [
+                    tg.create_task(
+                        self._generate_simple_artifact(artifact_type, ev.final_rfe)
+                    )
+                    for artifact_type, _ in PHASE_1_ARTIFACTS
+                ]
+        except* Exception as eg:
+            # Surface the underlying LLM error rather than the group wrapper
+            raise eg.exceptions[0]
+
+        for (artifact_type, display_name), task in zip(
+            PHASE_1_ARTIFACTS, artifact_tasks
+        ):
+            content = task.result()
             phase_1_artifacts[artifact_type.value] = content
 
             # Emit artifact
@@ -232,17 +262,13 @@ class RFEBuilderWorkflow(Workflow):
         )
 
     async def _summarize_agent_analyses(
-        self, ctx: Context, agent_insights: List[Dict]
+        self, ctx: Context, agent_insights: List[RFEAnalysis]
     ) -> None:
         """Summarize all agent analyses and stream as plain text to UI"""
 
         # Create summary prompt
         insights_text = "\n\n".join(
-            [
-                f"**{insight.get('persona', 'Agent')}:**\n{insight.get('analysis', 'No analysis')}"
-                for insight in agent_insights
-                if insight
-            ]
+            f"**{insight.persona}:**\n{insight.analysis}" for insight in agent_insights
         )
 
         summary_prompt = f"""
@@ -265,7 +291,7 @@ class RFEBuilderWorkflow(Workflow):
                 data={
                     "status": "generating",
                     "message": "Synthesizing insights from all agent analyses...",
-                    "timestamp": int(time.time() * 1000),  # milliseconds
+                    "timestamp": time.time_ns() // 1_000_000,  # milliseconds
                 },
             )
         )
@@ -288,7 +314,7 @@ class RFEBuilderWorkflow(Workflow):
                                 "status": "streaming",
                                 "summary": accumulated_text,
                                 "message": "Generating analysis summary...",
-                                "timestamp": int(time.time() * 1000),
+                                "timestamp": time.time_ns() // 1_000_000,
                             },
                         )
                     )
@@ -302,7 +328,7 @@ class RFEBuilderWorkflow(Workflow):
                         "status": "complete",
                         "summary": accumulated_text.strip(),
                         "message": "Agent analysis summary complete",
-                        "timestamp": int(time.time() * 1000),
+                        "timestamp": time.time_ns() // 1_000_000,
                     },
                 )
             )
@@ -313,22 +339,18 @@ class RFEBuilderWorkflow(Workflow):
                     data={
                         "status": "error",
                         "message": f"Failed to generate summary: {str(e)}",
-                        "timestamp": int(time.time() * 1000),
+                        "timestamp": time.time_ns() // 1_000_000,
                     },
                 )
             )
 
     async def _build_final_rfe(
-        self, user_input: str, agent_insights: List[Dict]
+        self, user_input: str, agent_insights: List[RFEAnalysis]
     ) -> str:
         """Simple RFE building from user input and agent insights"""
 
         insights_text = "\n".join(
-            [
-                f"{insight.get('persona', 'Agent')}: {insight.get('analysis', 'No analysis')}"
-                for insight in agent_insights
-                if insight
-            ]
+            f"{insight.persona}: {insight.analysis}" for insight in agent_insights
         )
 
         prompt = f"""
@@ -364,5 +386,14 @@ class RFEBuilderWorkflow(Workflow):
         return response.text.strip()
 
 
-# Export for LlamaDeploy
-rfe_builder_workflow = create_rfe_builder_workflow()
+@functools.cache
+def get_rfe_builder_workflow() -> Workflow:
+    """Create the shared workflow instance on first use"""
+    return create_rfe_builder_workflow()
+
+
+def __getattr__(name: str) -> Any:
+    # Export for LlamaDeploy, built lazily so importing this module has no side effects
+    if name == "rfe_builder_workflow":
+        return get_rfe_builder_workflow()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")